@@ -1,19 +1,44 @@
 """BrowserHDL - Headless Browser Module"""
 __version__ = "1.0.0"
 
-from .core import IBrowserAdapter, BrowserEvent, ProxyConfig, PageStatistics
-from .adapters import PlaywrightAdapter, SeleniumAdapter
-from .profiles import ProfileManager, ProfileMetadata
-from .cli import BrowserCLI
+import importlib
+
+from .core import IBrowserAdapter, BrowserAdapterBase, BrowserEvent, ProxyConfig, PageStatistics
+
+# Adapters, profiles and the CLI pull in Playwright and Selenium, so they are
+# only imported when first accessed
+_LAZY_IMPORTS = {
+    "PlaywrightAdapter": ".adapters.playwright_adapter",
+    "AsyncPlaywrightAdapter": ".adapters.playwright_async_adapter",
+    "SeleniumAdapter": ".adapters.selenium_adapter",
+    "ProfileManager": ".profiles",
+    "ProfileMetadata": ".profiles",
+    "BrowserCLI": ".cli.interactive_cli",
+}
 
 __all__ = [
     "IBrowserAdapter",
+    "BrowserAdapterBase",
     "BrowserEvent",
     "ProxyConfig",
     "PageStatistics",
     "PlaywrightAdapter",
+    "AsyncPlaywrightAdapter",
     "SeleniumAdapter",
     "ProfileManager",
     "ProfileMetadata",
     "BrowserCLI",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,24 @@
 """Browser adapters module"""
-from .playwright_adapter import PlaywrightAdapter
-from .selenium_adapter import SeleniumAdapter
+import importlib
 
-__all__ = ['PlaywrightAdapter', 'SeleniumAdapter']
+# Each adapter drags in its browser automation library; import on first use
+_LAZY_IMPORTS = {
+    'PlaywrightAdapter': '.playwright_adapter',
+    'AsyncPlaywrightAdapter': '.playwright_async_adapter',
+    'SeleniumAdapter': '.selenium_adapter',
+}
+
+__all__ = ['PlaywrightAdapter', 'AsyncPlaywrightAdapter', 'SeleniumAdapter']
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
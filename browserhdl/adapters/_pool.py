@@ -0,0 +1,106 @@
+"""
+Browser Pool - Keeps one Playwright driver and browser alive per engine
+"""
+import atexit
+import json
+import threading
+from typing import Dict, Any, Optional
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Playwright
+
+
+class BrowserPool:
+    """
+    Shared Playwright driver and browser for adapters of one engine.
+    
+    Starting the driver and launching a browser costs far more than
+    creating a context, so both are started once and kept alive. Every
+    adapter still gets a fresh context of its own, which it closes on
+    stop(), so no cookies, storage, permissions or cache leak from one
+    session into the next.
+    
+    Playwright's sync API objects are bound to the thread that created
+    them, so a pool must only be used from its owning thread. Use
+    get_pool() to obtain the pool for the current thread.
+    """
+    
+    def __init__(self, engine: str = "chromium", launch_options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize browser pool
+        
+        Args:
+            engine: Browser engine - 'chromium', 'firefox', or 'webkit'
+            launch_options: Options passed to browser_type.launch()
+        """
+        self.engine = engine
+        self.launch_options = dict(launch_options or {})
+        
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_browser(self) -> Browser:
+        """Launch the browser if it is not running"""
+        if self.browser is None or not self.browser.is_connected():
+            if self.playwright is None:
+                self.playwright = sync_playwright().start()
+            browser_type = getattr(self.playwright, self.engine)
+            self.browser = browser_type.launch(**self.launch_options)
+        return self.browser
+    
+    def new_context(self, **options) -> BrowserContext:
+        """
+        Create a fresh context in the shared browser
+        
+        Args:
+            options: Options passed to browser.new_context()
+        """
+        with self._lock:
+            return self._ensure_browser().new_context(**options)
+    
+    def close(self) -> None:
+        """Close the browser and Playwright"""
+        with self._lock:
+            if self.browser:
+                self.browser.close()
+                self.browser = None
+            if self.playwright:
+                self.playwright.stop()
+                self.playwright = None
+
+
+_local = threading.local()
+
+
+def get_pool(engine: str, launch_options: Optional[Dict[str, Any]] = None) -> BrowserPool:
+    """
+    Get the browser pool of the current thread for engine and launch options
+    
+    Args:
+        engine: Browser engine - 'chromium', 'firefox', or 'webkit'
+        launch_options: Options passed to browser_type.launch()
+    """
+    pools = getattr(_local, "pools", None)
+    if pools is None:
+        pools = _local.pools = {}
+    
+    key = (engine, json.dumps(launch_options or {}, sort_keys=True))
+    pool = pools.get(key)
+    if pool is None:
+        pool = pools[key] = BrowserPool(engine, launch_options)
+    return pool
+
+
+def close_all() -> None:
+    """Close every pool owned by the current thread"""
+    pools = getattr(_local, "pools", None)
+    if not pools:
+        return
+    for pool in pools.values():
+        try:
+            pool.close()
+        except Exception as e:
+            print(f"Error closing browser pool: {e}")
+    pools.clear()
+
+
+atexit.register(close_all)
@@ -1,20 +1,46 @@
 """
 Playwright Adapter - Supports Chromium, Firefox, and WebKit
 """
+import asyncio
+import re
+import threading
 import time
-from typing import Dict, Any, Optional, List
-from playwright.sync_api import sync_playwright, Browser, Page, Playwright
+from functools import partial
+from typing import Dict, Any, Optional, List, Sequence
+from playwright.sync_api import Browser, Page, Playwright
 
-from ..core.browser_interface import IBrowserAdapter, BrowserEvent, ProxyConfig, PageStatistics
+from ..core.browser_interface import (
+    BrowserAdapterBase, BrowserEvent, ProxyConfig, PageStatistics, DEFAULT_BLOCKED_RESOURCES,
+    COLLECT_STATS_JS
+)
+from ._pool import BrowserPool, get_pool, close_all
 
 
-class PlaywrightAdapter(IBrowserAdapter):
+# Key and value are passed as arguments, never interpolated into the source
+_LS_SET = "([k, v]) => localStorage.setItem(k, v)"
+_LS_SET_ALL = "items => { for (const [k, v] of Object.entries(items)) localStorage.setItem(k, v); }"
+
+# Page statistics collector
+_STATS_FN = f"() => {COLLECT_STATS_JS}"
+
+# Installed on every new document so the collector is compiled once per page
+STATS_JS = f"window.__bhStats = {_STATS_FN};"
+_CALL_STATS = "() => window.__bhStats ? window.__bhStats() : null"
+
+# Plain '#id' selectors are resolved with getElementById, falling back to
+# the CSS engine for elements inside open shadow roots
+_ID_RE = re.compile(r'^#[A-Za-z_][\w-]*$')
+_GET_BY_ID = "id => document.getElementById(id)"
+
+
+class PlaywrightAdapter(BrowserAdapterBase):
     """
     Playwright adapter supporting multiple browser engines
     """
     
     def __init__(self, engine: str = "chromium", headless: bool = True, 
-                 proxy: Optional[ProxyConfig] = None, **kwargs):
+                 proxy: Optional[ProxyConfig] = None,
+                 block_resources: Sequence[str] = DEFAULT_BLOCKED_RESOURCES, **kwargs):
         """
         Initialize Playwright adapter
         
@@ -22,6 +48,8 @@ class PlaywrightAdapter(IBrowserAdapter):
             engine: Browser engine - 'chromium', 'firefox', or 'webkit'
             headless: Run in headless mode
             proxy: Proxy configuration
+            block_resources: Playwright resource types to abort, e.g. 'image'
+                or 'stylesheet'. Pass an empty sequence to load everything.
         """
         super().__init__(headless, proxy)
         self.engine = engine.lower()
@@ -32,41 +60,36 @@ class PlaywrightAdapter(IBrowserAdapter):
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
         self.context = None
+        self._pool: Optional[BrowserPool] = None
+        self._cdp = None
+        self.block_resources = frozenset(block_resources)
+        self._loader = None
+        self._loader_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loader_thread: Optional[threading.Thread] = None
         self._start_time = 0
         
     def start(self) -> None:
         """Start Playwright browser"""
         try:
-            self.playwright = sync_playwright().start()
-            
-            # Browser launch options
-            launch_options = {
-                "headless": self.headless
-            }
+            launch_options = self._launch_options()
             
-            # Add proxy if configured
-            if self.proxy and self.proxy.enabled:
-                launch_options["proxy"] = {
-                    "server": f"{self.proxy.host}:{self.proxy.port}"
-                }
-                if self.proxy.username and self.proxy.password:
-                    launch_options["proxy"]["username"] = self.proxy.username
-                    launch_options["proxy"]["password"] = self.proxy.password
+            # Fresh context in the shared browser of this engine
+            self._pool = get_pool(self.engine, launch_options)
+            self.context = self._pool.new_context()
+            self.browser = self._pool.browser
+            self.playwright = self._pool.playwright
+            self.page = self.context.new_page()
+            if self.block_resources:
+                self.page.route("**/*", self._route_blocked)
+            self.page.add_init_script(script=STATS_JS)
             
-            # Launch browser based on engine
+            # Chromium reports navigation timing over CDP without running page script
             if self.engine == "chromium":
-                self.browser = self.playwright.chromium.launch(**launch_options)
-            elif self.engine == "firefox":
-                self.browser = self.playwright.firefox.launch(**launch_options)
-            elif self.engine == "webkit":
-                self.browser = self.playwright.webkit.launch(**launch_options)
-            
-            # Create context and page
-            self.context = self.browser.new_context()
-            self.page = self.context.new_page()
+                self._cdp = self.context.new_cdp_session(self.page)
+                self._cdp.send("Performance.enable")
             
             # Register event listeners
-            self.page.on("load", lambda: self.trigger_event(BrowserEvent.ON_LOAD))
+            self.page.on("load", lambda _: self.trigger_event(BrowserEvent.ON_LOAD))
             self.page.on("console", lambda msg: self.trigger_event(
                 BrowserEvent.ON_CONSOLE, msg.text))
             self.page.on("pageerror", lambda err: self.trigger_event(
@@ -78,35 +101,197 @@ class PlaywrightAdapter(IBrowserAdapter):
         except Exception as e:
             raise RuntimeError(f"Failed to start Playwright: {e}")
     
+    @classmethod
+    def shutdown_all(cls) -> None:
+        """
+        Close the shared browsers and Playwright driver of the current thread
+        
+        stop() only closes the adapter's own context, so the browser stays
+        up for the next adapter. Call this to tear it down
+        early; it also runs automatically at interpreter exit.
+        """
+        close_all()
+    
+    def _launch_options(self) -> Dict[str, Any]:
+        """Build browser launch options"""
+        launch_options = {
+            "headless": self.headless
+        }
+        
+        # Add proxy if configured
+        if self.proxy and self.proxy.enabled:
+            launch_options["proxy"] = {
+                "server": f"{self.proxy.host}:{self.proxy.port}"
+            }
+            if self.proxy.username and self.proxy.password:
+                launch_options["proxy"]["username"] = self.proxy.username
+                launch_options["proxy"]["password"] = self.proxy.password
+        
+        return launch_options
+    
+    def _route_blocked(self, route) -> None:
+        """Abort requests for blocked resource types"""
+        if route.request.resource_type in self.block_resources:
+            route.abort()
+        else:
+            route.continue_()
+    
     def stop(self) -> None:
-        """Stop Playwright browser"""
+        """Stop Playwright browser - the shared browser is left running"""
         try:
-            if self.page:
-                self.page.close()
+            self._stop_loader()
+            self._flush_stats_store()
+            if self._cdp:
+                self._cdp.detach()
+                self._cdp = None
             if self.context:
                 self.context.close()
-            if self.browser:
-                self.browser.close()
-            if self.playwright:
-                self.playwright.stop()
+            self.page = None
+            self.context = None
             
             self.trigger_event(BrowserEvent.ON_STOP)
             print("✓ Playwright stopped")
         except Exception as e:
             print(f"Error stopping Playwright: {e}")
     
-    def navigate(self, url: str) -> None:
-        """Navigate to URL"""
+    def navigate(self, url: str, wait_until: str = "domcontentloaded",
+                 ready_selector: Optional[str] = None, timeout: int = 30000) -> None:
+        """
+        Navigate to URL
+        
+        Args:
+            url: URL to navigate to
+            wait_until: Playwright load state to wait for - 'commit',
+                'domcontentloaded', 'load' or 'networkidle'
+            ready_selector: Optional selector that marks the page as ready
+            timeout: Navigation timeout in milliseconds
+        """
         if not self.page:
             raise RuntimeError("Browser not started")
         
-        self._start_time = time.time()
-        self.page.goto(url, wait_until="networkidle", timeout=60000)
+        self._start_time = time.perf_counter()
+        self._last_screenshot_hash = None
+        self.page.goto(url, wait_until=wait_until, timeout=timeout)
+        if ready_selector:
+            self.page.wait_for_selector(ready_selector, timeout=timeout)
         self.trigger_event(BrowserEvent.ON_NAVIGATE, url)
         
         # Collect statistics
         self._last_statistics = self.get_statistics()
     
+    def navigate_fast(self, url: str, timeout: int = 30000) -> None:
+        """
+        Navigate to URL and wait only for DOMContentLoaded
+        
+        On Chromium the navigation is sent straight over the adapter's CDP
+        session, skipping goto()'s response bookkeeping; the page's
+        domcontentloaded event marks completion. Other engines fall back to
+        navigate(url), which waits for the same state.
+        
+        Args:
+            url: URL to navigate to
+            timeout: Time to wait for DOMContentLoaded in milliseconds
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        if not self._cdp:
+            self.navigate(url, wait_until="domcontentloaded", timeout=timeout)
+            return
+        
+        self._start_time = time.perf_counter()
+        self._last_screenshot_hash = None
+        with self.page.expect_event("domcontentloaded", timeout=timeout):
+            result = self._cdp.send("Page.navigate", {"url": url})
+            if result.get("errorText"):
+                raise RuntimeError(f"Navigation to {url} failed: {result['errorText']}")
+        self.trigger_event(BrowserEvent.ON_NAVIGATE, url)
+        
+        # Collect statistics
+        self._last_statistics = self.get_statistics()
+    
+    def navigate_many(self, urls: List[str], concurrency: int = 4,
+                      wait_until: str = "domcontentloaded",
+                      timeout: int = 30000) -> List[Optional[PageStatistics]]:
+        """
+        Load several URLs in parallel and collect their statistics
+        
+        Playwright's sync objects cannot be shared between threads, so the
+        pages are loaded by an AsyncPlaywrightAdapter on a background event
+        loop, in one browser that is started by the first call and kept
+        until stop(). The adapter's own page is not touched. Statistics go
+        to the history like those of navigate().
+        
+        Args:
+            urls: URLs to load
+            concurrency: Maximum number of pages loading at the same time
+            wait_until: Playwright load state to wait for
+            timeout: Navigation timeout in milliseconds
+            
+        Returns:
+            Statistics in the order of urls, None for URLs that failed to load
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        if not urls:
+            return []
+        
+        loader = self._start_loader()
+        # This thread waits for the loop, so the loader can write straight
+        # into the history of this adapter
+        loader.statistics_history = self.statistics_history
+        return self._run_on_loader(
+            loader.gather_navigate(urls, concurrency, wait_until, timeout))
+    
+    def _start_loader(self):
+        """Start the background async adapter used by navigate_many()"""
+        if self._loader is not None:
+            return self._loader
+        
+        from .playwright_async_adapter import AsyncPlaywrightAdapter
+        
+        self._loader_loop = asyncio.new_event_loop()
+        self._loader_thread = threading.Thread(
+            target=self._loader_loop.run_forever, name="browserhdl-loader", daemon=True)
+        self._loader_thread.start()
+        
+        loader = AsyncPlaywrightAdapter(self.engine, self.headless, self.proxy,
+                                        self.block_resources)
+        # Page loads are reported through this adapter's handlers
+        for event in (BrowserEvent.ON_NAVIGATE, BrowserEvent.ON_ERROR):
+            loader.on(event, partial(self.trigger_event, event))
+        try:
+            self._run_on_loader(loader.start())
+        except Exception:
+            self._stop_loader()
+            raise
+        self._loader = loader
+        return loader
+    
+    def _run_on_loader(self, coro) -> Any:
+        """Run a coroutine on the loader's event loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loader_loop).result()
+    
+    def _stop_loader(self) -> None:
+        """Stop the navigate_many() browser and its event loop"""
+        if self._loader_loop is None:
+            return
+        try:
+            if self._loader is not None:
+                self._run_on_loader(self._loader.stop())
+        finally:
+            self._loader_loop.call_soon_threadsafe(self._loader_loop.stop)
+            self._loader_thread.join()
+            self._loader_loop.close()
+            self._loader = None
+            self._loader_loop = None
+            self._loader_thread = None
+    
+    def pump_events(self) -> None:
+        """Give Playwright a chance to dispatch queued page events"""
+        if self.page:
+            # The sync API only runs event callbacks inside its own calls
+            self.page.wait_for_timeout(0)
+    
     def get_html(self) -> str:
         """Get current page HTML"""
         if not self.page:
@@ -124,10 +309,21 @@ class PlaywrightAdapter(IBrowserAdapter):
         if not self.page:
             raise RuntimeError("Browser not started")
         try:
-            return self.page.query_selector(selector)
+            return self._query_selector(selector)
         except:
             return None
     
+    def _query_selector(self, selector: str) -> Optional[Any]:
+        """Single element lookup"""
+        if _ID_RE.match(selector):
+            handle = self.page.evaluate_handle(_GET_BY_ID, selector[1:])
+            element = handle.as_element()
+            if element is not None:
+                return element
+            # Not in the light DOM - the CSS engine also searches shadow roots
+            handle.dispose()
+        return self.page.query_selector(selector)
+    
     def find_elements(self, selector: str) -> List[Any]:
         """Find all elements by CSS selector"""
         if not self.page:
@@ -146,11 +342,12 @@ class PlaywrightAdapter(IBrowserAdapter):
             raise RuntimeError("Browser not started")
         self.page.fill(selector, value)
     
-    def screenshot(self, path: str) -> None:
-        """Take screenshot"""
+    def screenshot(self, path: str) -> bool:
+        """Take screenshot, skipping the write if nothing changed since the last one"""
         if not self.page:
             raise RuntimeError("Browser not started")
-        self.page.screenshot(path=path, full_page=True)
+        return self._write_screenshot(path, self.page.screenshot(
+            full_page=True, type=_screenshot_type(path)))
     
     def get_cookies(self) -> List[Dict[str, Any]]:
         """Get all cookies"""
@@ -160,16 +357,14 @@ class PlaywrightAdapter(IBrowserAdapter):
     
     def set_cookie(self, name: str, value: str, **kwargs) -> None:
         """Set a cookie"""
+        self.set_cookies([{"name": name, "value": value, **kwargs}])
+    
+    def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Set several cookies in one call, scoping them to the current page by default"""
         if not self.context:
             raise RuntimeError("Browser not started")
-        
-        cookie = {
-            "name": name,
-            "value": value,
-            "url": self.page.url if self.page else "https://example.com"
-        }
-        cookie.update(kwargs)
-        self.context.add_cookies([cookie])
+        self.context.add_cookies(_scoped_cookies(
+            cookies, self.page.url if self.page else "https://example.com"))
     
     def delete_cookie(self, name: str) -> None:
         """Delete a cookie"""
@@ -182,16 +377,7 @@ class PlaywrightAdapter(IBrowserAdapter):
         if not self.page:
             raise RuntimeError("Browser not started")
         
-        script = """
-        () => {
-            let items = {};
-            for (let i = 0; i < localStorage.length; i++) {
-                let key = localStorage.key(i);
-                items[key] = localStorage.getItem(key);
-            }
-            return items;
-        }
-        """
+        script = "() => Object.fromEntries(Object.entries(localStorage))"
         return self.page.evaluate(script)
     
     def set_local_storage(self, key: str, value: str) -> None:
@@ -199,8 +385,14 @@ class PlaywrightAdapter(IBrowserAdapter):
         if not self.page:
             raise RuntimeError("Browser not started")
         
-        script = f"localStorage.setItem('{key}', '{value}')"
-        self.page.evaluate(script)
+        self.page.evaluate(_LS_SET, [key, value])
+    
+    def set_local_storage_bulk(self, items: Dict[str, str]) -> None:
+        """Set several localStorage items in one call"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        
+        self.page.evaluate(_LS_SET_ALL, items)
     
     def wait_for_selector(self, selector: str, timeout: int = 30000) -> None:
         """Wait for element to appear"""
@@ -208,59 +400,105 @@ class PlaywrightAdapter(IBrowserAdapter):
             raise RuntimeError("Browser not started")
         self.page.wait_for_selector(selector, timeout=timeout)
     
-    def get_statistics(self) -> PageStatistics:
-        """Get page statistics"""
+    def _batch_methods(self) -> Dict[str, Any]:
+        """Dispatch batched actions straight to the page"""
         if not self.page:
             raise RuntimeError("Browser not started")
-        
-        # Collect various metrics
-        html = self.get_html()
-        load_time = time.time() - self._start_time if self._start_time else 0
-        
-        # Count elements
-        stats_script = """
-        () => {
-            return {
-                numTags: document.querySelectorAll('*').length,
-                numForms: document.forms.length,
-                numLinks: document.links.length,
-                numButtons: document.querySelectorAll('button').length,
-                numInputs: document.querySelectorAll('input').length,
-                numImages: document.images.length,
-                title: document.title
-            }
-        }
+        methods = super()._batch_methods()
+        methods.update({
+            "click": self.page.click,
+            "fill": self.page.fill,
+            "wait": self.page.wait_for_selector,
+            "wait_for_selector": self.page.wait_for_selector,
+            "execute": self.page.evaluate,
+            "execute_script": self.page.evaluate,
+        })
+        return methods
+    
+    def _load_time(self) -> float:
         """
+        Seconds from navigation start to DOMContentLoaded
         
-        try:
-            stats = self.page.evaluate(stats_script)
-        except:
-            stats = {
-                'numTags': 0,
-                'numForms': 0,
-                'numLinks': 0,
-                'numButtons': 0,
-                'numInputs': 0,
-                'numImages': 0,
-                'title': ''
-            }
-        
-        # Get cookies size
-        cookies = self.get_cookies()
-        cookies_size = sum(len(str(c)) for c in cookies)
+        Taken from CDP performance metrics on Chromium; other engines, or
+        pages where the metric is not available yet, fall back to the time
+        elapsed since navigate() was called.
+        """
+        if self._cdp:
+            try:
+                load_time = _dom_content_loaded_time(self._cdp.send("Performance.getMetrics"))
+                if load_time is not None:
+                    return load_time
+            except Exception:
+                pass
+        return time.perf_counter() - self._start_time if self._start_time else 0
+    
+    def get_statistics(self) -> PageStatistics:
+        """Get page statistics"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
         
-        return PageStatistics(
-            url=self.page.url,
-            load_time=load_time,
-            size_bytes=len(html.encode('utf-8')),
-            num_tags=stats.get('numTags', 0),
-            num_forms=stats.get('numForms', 0),
-            num_links=stats.get('numLinks', 0),
-            num_buttons=stats.get('numButtons', 0),
-            num_inputs=stats.get('numInputs', 0),
-            num_images=stats.get('numImages', 0),
-            cookies_size=cookies_size,
-            page_title=stats.get('title', ''),
-            status_code=200,  # Playwright doesn't expose this easily
-            content_type='text/html'
-        )
+        # Not cached: a fingerprint probe would serialize the page just like
+        # the collector does, so a hit would save nothing here
+        return _collect_statistics(self.page, self._load_time())
+
+
+def _collect_statistics(page: Page, load_time: float) -> PageStatistics:
+    """
+    Collect statistics for a loaded page
+    
+    Args:
+        page: Playwright page to inspect
+        load_time: Load time to report, in seconds
+    """
+    # Collect page size and element counts in a single round-trip. The
+    # collector is normally preinstalled by the init script; documents
+    # loaded before it was registered get the full function shipped.
+    try:
+        stats = page.evaluate(_CALL_STATS)
+        if stats is None:
+            stats = page.evaluate(_STATS_FN)
+    except:
+        stats = {}
+    
+    return _build_statistics(page.url, load_time, stats)
+
+
+def _screenshot_type(path: str) -> str:
+    """Image format for a screenshot path - JPEG for .jpg/.jpeg, PNG otherwise"""
+    return "jpeg" if path.lower().endswith((".jpg", ".jpeg")) else "png"
+
+
+def _scoped_cookies(cookies: List[Dict[str, Any]], url: str) -> List[Dict[str, Any]]:
+    """Give cookies without a url or domain the url of the current page"""
+    return [c if c.get("url") or c.get("domain") else {**c, "url": url} for c in cookies]
+
+
+def _dom_content_loaded_time(response: Dict[str, Any]) -> Optional[float]:
+    """Extract DOMContentLoaded time from a Performance.getMetrics response"""
+    metrics = {m["name"]: m["value"] for m in response["metrics"]}
+    start = metrics.get("NavigationStart", 0)
+    loaded = metrics.get("DomContentLoaded", 0)
+    if start and loaded >= start:
+        return loaded - start
+    return None
+
+
+def _build_statistics(url: str, load_time: float, stats: Dict[str, Any]) -> PageStatistics:
+    """Build PageStatistics from the result of the stats collector"""
+    return PageStatistics(
+        url=url,
+        load_time=load_time,
+        size_bytes=stats.get('sizeBytes', 0),
+        num_tags=stats.get('numTags', 0),
+        num_forms=stats.get('numForms', 0),
+        num_links=stats.get('numLinks', 0),
+        num_buttons=stats.get('numButtons', 0),
+        num_inputs=stats.get('numInputs', 0),
+        num_images=stats.get('numImages', 0),
+        # Cookie size is the length of document.cookie as seen by the page,
+        # i.e. the name=value pairs sent to this URL (HttpOnly cookies excluded)
+        cookies_size=stats.get('cookieLen', 0),
+        page_title=stats.get('title', ''),
+        status_code=200,  # Playwright doesn't expose this easily
+        content_type='text/html'
+    )
@@ -0,0 +1,375 @@
+"""
+Async Playwright Adapter - asyncio flavour of the Playwright adapter
+"""
+import asyncio
+import time
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from playwright.async_api import async_playwright, Browser, Page, Playwright
+
+from ..core.browser_interface import (
+    BrowserAdapterBase, BrowserEvent, ProxyConfig, PageStatistics, DEFAULT_BLOCKED_RESOURCES
+)
+from .playwright_adapter import (
+    STATS_JS, _STATS_FN, _CALL_STATS, _LS_SET, _LS_SET_ALL,
+    _ID_RE, _GET_BY_ID,
+    _build_statistics, _dom_content_loaded_time, _scoped_cookies,
+    _screenshot_type
+)
+
+
+class AsyncPlaywrightAdapter(BrowserAdapterBase):
+    """
+    Playwright adapter built on the async API.
+    
+    Every browser operation is a coroutine, so one thread can keep many
+    pages waiting on the network at the same time. Method names and
+    arguments match PlaywrightAdapter; await them from an event loop.
+    """
+    
+    def __init__(self, engine: str = "chromium", headless: bool = True,
+                 proxy: Optional[ProxyConfig] = None,
+                 block_resources: Sequence[str] = DEFAULT_BLOCKED_RESOURCES, **kwargs):
+        """
+        Initialize async Playwright adapter
+        
+        Args:
+            engine: Browser engine - 'chromium', 'firefox', or 'webkit'
+            headless: Run in headless mode
+            proxy: Proxy configuration
+            block_resources: Playwright resource types to abort, e.g. 'image'
+                or 'stylesheet'. Pass an empty sequence to load everything.
+        """
+        super().__init__(headless, proxy)
+        self.engine = engine.lower()
+        if self.engine not in ['chromium', 'firefox', 'webkit']:
+            raise ValueError(f"Unsupported engine: {engine}")
+        
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.page: Optional[Page] = None
+        self.context = None
+        self.block_resources = frozenset(block_resources)
+        self._cdp = None
+        self._start_time = 0
+    
+    async def start(self) -> None:
+        """Start Playwright browser"""
+        try:
+            self.playwright = await async_playwright().start()
+            
+            launch_options = {
+                "headless": self.headless
+            }
+            if self.proxy and self.proxy.enabled:
+                launch_options["proxy"] = {
+                    "server": f"{self.proxy.host}:{self.proxy.port}"
+                }
+                if self.proxy.username and self.proxy.password:
+                    launch_options["proxy"]["username"] = self.proxy.username
+                    launch_options["proxy"]["password"] = self.proxy.password
+            
+            browser_type = getattr(self.playwright, self.engine)
+            self.browser = await browser_type.launch(**launch_options)
+            self.context = await self.browser.new_context()
+            self.page = await self._new_page()
+            
+            if self.engine == "chromium":
+                self._cdp = await self.context.new_cdp_session(self.page)
+                await self._cdp.send("Performance.enable")
+            
+            # Register event listeners
+            self.page.on("load", lambda _: self.trigger_event(BrowserEvent.ON_LOAD))
+            self.page.on("console", lambda msg: self.trigger_event(
+                BrowserEvent.ON_CONSOLE, msg.text))
+            self.page.on("pageerror", lambda err: self.trigger_event(
+                BrowserEvent.ON_ERROR, str(err)))
+            
+            self.trigger_event(BrowserEvent.ON_START)
+            print(f"✓ Playwright {self.engine} (async) started")
+        
+        except Exception as e:
+            raise RuntimeError(f"Failed to start Playwright: {e}")
+    
+    async def _new_page(self) -> Page:
+        """Open a page in the adapter's context with blocking and stats installed"""
+        page = await self.context.new_page()
+        if self.block_resources:
+            await page.route("**/*", self._route_blocked)
+        await page.add_init_script(script=STATS_JS)
+        return page
+    
+    async def _route_blocked(self, route) -> None:
+        """Abort requests for blocked resource types"""
+        if route.request.resource_type in self.block_resources:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def stop(self) -> None:
+        """Stop Playwright browser"""
+        try:
+            self._flush_stats_store()
+            if self.page:
+                await self.page.close()
+            if self.context:
+                await self.context.close()
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+            
+            self.trigger_event(BrowserEvent.ON_STOP)
+            print("✓ Playwright stopped")
+        except Exception as e:
+            print(f"Error stopping Playwright: {e}")
+    
+    async def navigate(self, url: str, wait_until: str = "domcontentloaded",
+                       ready_selector: Optional[str] = None, timeout: int = 30000) -> None:
+        """
+        Navigate to URL
+        
+        Args:
+            url: URL to navigate to
+            wait_until: Playwright load state to wait for - 'commit',
+                'domcontentloaded', 'load' or 'networkidle'
+            ready_selector: Optional selector that marks the page as ready
+            timeout: Navigation timeout in milliseconds
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        
+        self._start_time = time.perf_counter()
+        self._last_screenshot_hash = None
+        await self.page.goto(url, wait_until=wait_until, timeout=timeout)
+        if ready_selector:
+            await self.page.wait_for_selector(ready_selector, timeout=timeout)
+        self.trigger_event(BrowserEvent.ON_NAVIGATE, url)
+        
+        # Collect statistics
+        self._last_statistics = await self.get_statistics()
+    
+    async def gather_navigate(self, urls: List[str], concurrency: int = 4,
+                              wait_until: str = "domcontentloaded",
+                              timeout: int = 30000) -> List[Optional[PageStatistics]]:
+        """
+        Load several URLs concurrently, one page each, and collect their statistics
+        
+        The statistics go to the history like those of navigate(), but the
+        adapter's own page and last statistics are not touched.
+        
+        Args:
+            urls: URLs to load
+            concurrency: Maximum number of pages open at the same time
+            wait_until: Playwright load state to wait for
+            timeout: Navigation timeout in milliseconds
+        
+        Returns:
+            Statistics in the order of urls, None for URLs that failed to load
+        """
+        if not self.context:
+            raise RuntimeError("Browser not started")
+        
+        slots = asyncio.Semaphore(max(1, concurrency))
+        
+        async def load(url: str) -> Optional[PageStatistics]:
+            async with slots:
+                page = await self._new_page()
+                try:
+                    start = time.perf_counter()
+                    await page.goto(url, wait_until=wait_until, timeout=timeout)
+                    stats = await _collect_statistics(page, time.perf_counter() - start)
+                    self.statistics_history.append(stats)
+                    self.trigger_event(BrowserEvent.ON_NAVIGATE, url)
+                    return stats
+                except Exception as e:
+                    self.trigger_event(BrowserEvent.ON_ERROR, f"{url}: {e}")
+                    return None
+                finally:
+                    await page.close()
+        
+        return list(await asyncio.gather(*(load(url) for url in urls)))
+    
+    async def get_html(self) -> str:
+        """Get current page HTML"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        return await self.page.content()
+    
+    async def execute_script(self, script: str) -> Any:
+        """Execute JavaScript"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        return await self.page.evaluate(script)
+    
+    async def find_element(self, selector: str) -> Optional[Any]:
+        """Find element by CSS selector"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        try:
+            if _ID_RE.match(selector):
+                handle = await self.page.evaluate_handle(_GET_BY_ID, selector[1:])
+                element = handle.as_element()
+                if element is not None:
+                    return element
+                # Not in the light DOM - the CSS engine also searches shadow roots
+                await handle.dispose()
+            return await self.page.query_selector(selector)
+        except:
+            return None
+    
+    async def find_elements(self, selector: str) -> List[Any]:
+        """Find all elements by CSS selector"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        return await self.page.query_selector_all(selector)
+    
+    async def click(self, selector: str) -> None:
+        """Click element"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        await self.page.click(selector)
+    
+    async def fill(self, selector: str, value: str) -> None:
+        """Fill input field"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        await self.page.fill(selector, value)
+    
+    async def screenshot(self, path: str) -> bool:
+        """Take screenshot, skipping the write if nothing changed since the last one"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        return self._write_screenshot(path, await self.page.screenshot(
+            full_page=True, type=_screenshot_type(path)))
+    
+    async def get_cookies(self) -> List[Dict[str, Any]]:
+        """Get all cookies"""
+        if not self.context:
+            raise RuntimeError("Browser not started")
+        return await self.context.cookies()
+    
+    async def set_cookie(self, name: str, value: str, **kwargs) -> None:
+        """Set a cookie"""
+        await self.set_cookies([{"name": name, "value": value, **kwargs}])
+    
+    async def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Set several cookies in one call, scoping them to the current page by default"""
+        if not self.context:
+            raise RuntimeError("Browser not started")
+        await self.context.add_cookies(_scoped_cookies(
+            cookies, self.page.url if self.page else "https://example.com"))
+    
+    async def delete_cookie(self, name: str) -> None:
+        """Delete a cookie"""
+        if not self.context:
+            raise RuntimeError("Browser not started")
+        await self.context.clear_cookies()
+    
+    async def get_local_storage(self) -> Dict[str, str]:
+        """Get localStorage contents"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        return await self.page.evaluate("() => Object.fromEntries(Object.entries(localStorage))")
+    
+    async def set_local_storage(self, key: str, value: str) -> None:
+        """Set localStorage item"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        await self.page.evaluate(_LS_SET, [key, value])
+    
+    async def set_local_storage_bulk(self, items: Dict[str, str]) -> None:
+        """Set several localStorage items in one call"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        await self.page.evaluate(_LS_SET_ALL, items)
+    
+    async def wait_for_selector(self, selector: str, timeout: int = 30000) -> None:
+        """Wait for element to appear"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        await self.page.wait_for_selector(selector, timeout=timeout)
+    
+    async def batch(self, ops: List[Tuple[str, Any]]) -> List[Any]:
+        """
+        Run a sequence of operations, then collect statistics once
+        
+        Args:
+            ops: (operation, arguments) pairs, see BrowserAdapterBase.batch
+            
+        Returns:
+            Result of each operation, in order
+        """
+        methods = self._batch_methods()
+        results = []
+        for op, args in ops:
+            method = methods.get(op)
+            if method is None:
+                raise ValueError(f"Unsupported batch operation: {op}")
+            if isinstance(args, dict):
+                results.append(await method(**args))
+            else:
+                results.append(await method(*args))
+        
+        self._last_statistics = await self.get_statistics()
+        return results
+    
+    async def load_profile(self, profile_data: Dict[str, Any]) -> None:
+        """
+        Load user profile (cookies, localStorage, etc.)
+        
+        Args:
+            profile_data: Dictionary containing profile data
+        """
+        if "cookies" in profile_data:
+            try:
+                await self.set_cookies(profile_data["cookies"])
+            except Exception:
+                for cookie in profile_data["cookies"]:
+                    try:
+                        await self.set_cookie(**cookie)
+                    except Exception as e:
+                        print(f"Failed to set cookie: {e}")
+        
+        if "localStorage" in profile_data:
+            try:
+                await self.set_local_storage_bulk(profile_data["localStorage"])
+            except Exception as e:
+                print(f"Failed to set localStorage: {e}")
+    
+    async def _load_time(self) -> float:
+        """Seconds from navigation start to DOMContentLoaded, see PlaywrightAdapter"""
+        if self._cdp:
+            try:
+                load_time = _dom_content_loaded_time(
+                    await self._cdp.send("Performance.getMetrics"))
+                if load_time is not None:
+                    return load_time
+            except Exception:
+                pass
+        return time.perf_counter() - self._start_time if self._start_time else 0
+    
+    async def get_statistics(self) -> PageStatistics:
+        """Get page statistics"""
+        if not self.page:
+            raise RuntimeError("Browser not started")
+        
+        # Not cached, see PlaywrightAdapter.get_statistics()
+        return await _collect_statistics(self.page, await self._load_time())
+
+
+async def _collect_statistics(page: Page, load_time: float) -> PageStatistics:
+    """
+    Collect statistics for a loaded page
+    
+    Args:
+        page: Playwright page to inspect
+        load_time: Load time to report, in seconds
+    """
+    try:
+        stats = await page.evaluate(_CALL_STATS)
+        if stats is None:
+            stats = await page.evaluate(_STATS_FN)
+    except:
+        stats = {}
+    
+    return _build_statistics(page.url, load_time, stats)
@@ -2,23 +2,38 @@
 Selenium Adapter - Supports Chrome, Firefox, Edge, and Safari
 """
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException
+)
 
-from ..core.browser_interface import IBrowserAdapter, BrowserEvent, ProxyConfig, PageStatistics
+from ..core.browser_interface import (
+    BrowserAdapterBase, BrowserEvent, ProxyConfig, PageStatistics, DEFAULT_BLOCKED_RESOURCES,
+    COLLECT_STATS_JS, STATS_KEY_JS
+)
 
 
-class SeleniumAdapter(IBrowserAdapter):
+# Page statistics collector, registered on window by the first call per document
+STATS_INSTALL_JS = f"""
+window.__bhStats = function() {COLLECT_STATS_JS};
+return window.__bhStats();
+"""
+_CALL_STATS = "return window.__bhStats ? window.__bhStats() : null;"
+_STATS_KEY = f"return {STATS_KEY_JS};"
+
+
+class SeleniumAdapter(BrowserAdapterBase):
     """
     Selenium WebDriver adapter supporting multiple browsers
     """
     
     def __init__(self, browser: str = "chrome", headless: bool = True,
-                 proxy: Optional[ProxyConfig] = None, **kwargs):
+                 proxy: Optional[ProxyConfig] = None,
+                 block_resources: Sequence[str] = DEFAULT_BLOCKED_RESOURCES, **kwargs):
         """
         Initialize Selenium adapter
         
@@ -26,13 +41,17 @@ class SeleniumAdapter(IBrowserAdapter):
             browser: Browser type - 'chrome', 'firefox', 'edge', or 'safari'
             headless: Run in headless mode
             proxy: Proxy configuration
+            block_resources: Resource types to skip loading. WebDriver can
+                only switch off 'image' and 'font'; other types are ignored.
         """
         super().__init__(headless, proxy)
         self.browser_type = browser.lower()
         if self.browser_type not in ['chrome', 'firefox', 'edge', 'safari']:
             raise ValueError(f"Unsupported browser: {browser}")
         
+        self.block_resources = frozenset(block_resources)
         self.driver = None
+        self._stats_installed = False
         self._start_time = 0
         
     def start(self) -> None:
@@ -44,6 +63,7 @@ class SeleniumAdapter(IBrowserAdapter):
                     options.add_argument('--headless')
                 options.add_argument('--no-sandbox')
                 options.add_argument('--disable-dev-shm-usage')
+                self._add_blink_block_args(options)
                 
                 if self.proxy and self.proxy.enabled:
                     options.add_argument(f'--proxy-server={self.proxy.host}:{self.proxy.port}')
@@ -54,6 +74,10 @@ class SeleniumAdapter(IBrowserAdapter):
                 options = webdriver.FirefoxOptions()
                 if self.headless:
                     options.add_argument('--headless')
+                if "image" in self.block_resources:
+                    options.set_preference('permissions.default.image', 2)
+                if "font" in self.block_resources:
+                    options.set_preference('gfx.downloadable_fonts.enabled', False)
                 
                 if self.proxy and self.proxy.enabled:
                     options.set_preference('network.proxy.type', 1)
@@ -68,6 +92,7 @@ class SeleniumAdapter(IBrowserAdapter):
                 options = webdriver.EdgeOptions()
                 if self.headless:
                     options.add_argument('--headless')
+                self._add_blink_block_args(options)
                 
                 if self.proxy and self.proxy.enabled:
                     options.add_argument(f'--proxy-server={self.proxy.host}:{self.proxy.port}')
@@ -84,9 +109,17 @@ class SeleniumAdapter(IBrowserAdapter):
         except Exception as e:
             raise RuntimeError(f"Failed to start Selenium: {e}")
     
+    def _add_blink_block_args(self, options) -> None:
+        """Add Chromium switches for blocked resource types"""
+        if "image" in self.block_resources:
+            options.add_argument('--blink-settings=imagesEnabled=false')
+        if "font" in self.block_resources:
+            options.add_argument('--disable-remote-fonts')
+    
     def stop(self) -> None:
         """Stop Selenium WebDriver"""
         try:
+            self._flush_stats_store()
             if self.driver:
                 self.driver.quit()
             
@@ -100,8 +133,11 @@ class SeleniumAdapter(IBrowserAdapter):
         if not self.driver:
             raise RuntimeError("Browser not started")
         
-        self._start_time = time.time()
+        self._start_time = time.perf_counter()
+        self._last_screenshot_hash = None
         self.driver.get(url)
+        # New document - window.__bhStats has to be registered again
+        self._stats_installed = False
         self.trigger_event(BrowserEvent.ON_NAVIGATE, url)
         
         # Collect statistics
@@ -151,11 +187,17 @@ class SeleniumAdapter(IBrowserAdapter):
         else:
             raise NoSuchElementException(f"Element not found: {selector}")
     
-    def screenshot(self, path: str) -> None:
-        """Take screenshot"""
+    def screenshot(self, path: str) -> bool:
+        """
+        Take screenshot, skipping the write if nothing changed since the last one
+        
+        The image is always PNG, whatever the extension of path. Unlike
+        WebDriver's save_screenshot(), which returned False, a file that
+        cannot be written raises OSError.
+        """
         if not self.driver:
             raise RuntimeError("Browser not started")
-        self.driver.save_screenshot(path)
+        return self._write_screenshot(path, self.driver.get_screenshot_as_png())
     
     def get_cookies(self) -> List[Dict[str, Any]]:
         """Get all cookies"""
@@ -175,6 +217,33 @@ class SeleniumAdapter(IBrowserAdapter):
         cookie.update(kwargs)
         self.driver.add_cookie(cookie)
     
+    def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Set several cookies at once
+        
+        Chrome and Edge take the whole list in one CDP Network.setCookies
+        command, which also accepts cookies for domains other than the
+        current page. Other browsers add them one by one.
+        """
+        if not self.driver:
+            raise RuntimeError("Browser not started")
+        
+        if self.browser_type in ("chrome", "edge"):
+            url = self.driver.current_url
+            params = []
+            for cookie in cookies:
+                cookie = dict(cookie)
+                # WebDriver calls the expiry timestamp 'expiry', CDP 'expires'
+                if "expiry" in cookie:
+                    cookie["expires"] = cookie.pop("expiry")
+                if not cookie.get("url") and not cookie.get("domain"):
+                    cookie["url"] = url
+                params.append(cookie)
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+        else:
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+    
     def delete_cookie(self, name: str) -> None:
         """Delete a cookie"""
         if not self.driver:
@@ -186,23 +255,25 @@ class SeleniumAdapter(IBrowserAdapter):
         if not self.driver:
             raise RuntimeError("Browser not started")
         
-        script = """
-        let items = {};
-        for (let i = 0; i < localStorage.length; i++) {
-            let key = localStorage.key(i);
-            items[key] = localStorage.getItem(key);
-        }
-        return items;
-        """
-        return self.execute_script(script)
+        script = "return Object.fromEntries(Object.entries(localStorage));"
+        return self.driver.execute_script(script)
     
     def set_local_storage(self, key: str, value: str) -> None:
         """Set localStorage item"""
         if not self.driver:
             raise RuntimeError("Browser not started")
         
-        script = f"localStorage.setItem('{key}', '{value}')"
-        self.execute_script(script)
+        self.driver.execute_script(
+            "localStorage.setItem(arguments[0], arguments[1]);", key, value)
+    
+    def set_local_storage_bulk(self, items: Dict[str, str]) -> None:
+        """Set several localStorage items in one call"""
+        if not self.driver:
+            raise RuntimeError("Browser not started")
+        
+        self.driver.execute_script(
+            "for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);",
+            items)
     
     def wait_for_selector(self, selector: str, timeout: int = 30000) -> None:
         """Wait for element to appear"""
@@ -216,32 +287,43 @@ class SeleniumAdapter(IBrowserAdapter):
         except TimeoutException:
             raise TimeoutException(f"Element not found within {timeout}ms: {selector}")
     
+    def _stats_scope(self) -> str:
+        """Name under which the statistics store keeps this adapter's entries"""
+        return f"selenium-{self.browser_type}:{','.join(sorted(self.block_resources))}"
+    
     def get_statistics(self) -> PageStatistics:
         """Get page statistics"""
         if not self.driver:
             raise RuntimeError("Browser not started")
         
-        # Collect various metrics
-        html = self.get_html()
-        load_time = time.time() - self._start_time if self._start_time else 0
+        load_time = time.perf_counter() - self._start_time if self._start_time else 0
         
-        # Count elements using JavaScript
-        stats_script = """
-        return {
-            numTags: document.querySelectorAll('*').length,
-            numForms: document.forms.length,
-            numLinks: document.links.length,
-            numButtons: document.querySelectorAll('button').length,
-            numInputs: document.querySelectorAll('input').length,
-            numImages: document.images.length,
-            title: document.title
-        }
-        """
+        try:
+            key = tuple(self.driver.execute_script(_STATS_KEY))
+        except Exception:
+            return self._collect_statistics(load_time)
         
+        stats = self._stats_cache_get(key, load_time)
+        if stats is None:
+            stats = self._collect_statistics(load_time)
+            self._stats_cache_put(key, stats)
+        return stats
+    
+    def _collect_statistics(self, load_time: float) -> PageStatistics:
+        """Collect statistics for the current page"""
+        # Count elements using JavaScript. The collector stays on window for
+        # the lifetime of the document, so only the first call per page
+        # ships its source.
         try:
-            stats = self.execute_script(stats_script)
+            stats = None
+            if self._stats_installed:
+                stats = self.driver.execute_script(_CALL_STATS)
+            if stats is None:
+                stats = self.driver.execute_script(STATS_INSTALL_JS)
+                self._stats_installed = True
         except:
             stats = {
+                'sizeBytes': 0,
                 'numTags': 0,
                 'numForms': 0,
                 'numLinks': 0,
@@ -251,14 +333,14 @@ class SeleniumAdapter(IBrowserAdapter):
                 'title': ''
             }
         
-        # Get cookies size
+        # Get cookies size - name and value lengths, as sent in the Cookie header
         cookies = self.get_cookies()
-        cookies_size = sum(len(str(c)) for c in cookies)
+        cookies_size = sum(len(c.get('name', '')) + len(c.get('value', '')) for c in cookies)
         
         return PageStatistics(
             url=self.driver.current_url,
             load_time=load_time,
-            size_bytes=len(html.encode('utf-8')),
+            size_bytes=stats.get('sizeBytes', 0),
             num_tags=stats.get('numTags', 0),
             num_forms=stats.get('numForms', 0),
             num_links=stats.get('numLinks', 0),
@@ -2,43 +2,166 @@
 Interactive CLI - Command Line Interface for headless browser control
 Features multi-line script input, statistics display, and interactive control
 """
+import importlib
 import sys
-import os
-import re
 import time
-from typing import Optional, Dict, Any, List
-from pathlib import Path
+import queue
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from types import CodeType
+from typing import Optional, Dict, Callable, Deque, Sequence
 
 from ..core.browser_interface import IBrowserAdapter, BrowserEvent
-from ..adapters.playwright_adapter import PlaywrightAdapter
-from ..adapters.selenium_adapter import SeleniumAdapter
+from ..core.stats_cache import StatsCache
 from ..profiles.profile_manager import ProfileManager
 
 
+# Seconds between browser event pumps while waiting for input
+EVENT_POLL_INTERVAL = 0.05
+
+# Maximum number of compiled commands and scripts kept for reuse
+COMPILE_CACHE_SIZE = 256
+
+
+_PLAYWRIGHT = "..adapters.playwright_adapter:PlaywrightAdapter"
+_SELENIUM = "..adapters.selenium_adapter:SeleniumAdapter"
+
+# Adapter classes by "module:Class" path, imported on first use
+_RESOLVED: Dict[str, Callable[..., IBrowserAdapter]] = {}
+
+
+def _adapter_class(path: str) -> Callable[..., IBrowserAdapter]:
+    """Import the adapter class named by a "module:Class" path"""
+    adapter_class = _RESOLVED.get(path)
+    if adapter_class is None:
+        module_name, class_name = path.split(":")
+        adapter_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        _RESOLVED[path] = adapter_class
+    return adapter_class
+
+
+@lru_cache(maxsize=1024)
+def _normalize_selector(selector: str) -> str:
+    """Strip and validate a selector typed at the prompt"""
+    selector = selector.strip()
+    # Only empty selectors are rejected here; the browser validates the rest
+    if not selector:
+        raise ValueError(f"Invalid selector: {selector!r}")
+    return selector
+
+
+# Help text, built once. main() swaps the box drawing for ASCII when
+# stdout is not a terminal.
+_HELP_TEXT = """
+╔══════════════════════════════════════════════════════════════╗
+║            BrowserHDL - Interactive CLI Help                 ║
+╠══════════════════════════════════════════════════════════════╣
+║ Navigation & Content:                                        ║
+║   navigate(url)          - Navigate to URL                   ║
+║   html()                 - Get page HTML                     ║
+║   refresh()              - Refresh current page              ║
+║   back()                 - Go back                           ║
+║   forward()              - Go forward                        ║
+║                                                              ║
+║ Element Interaction:                                         ║
+║   find(selector)         - Find element by CSS selector      ║
+║   click(selector)        - Click element                     ║
+║   fill(selector, value)  - Fill input field                  ║
+║   wait(selector)         - Wait for element                  ║
+║   chain(ops)             - Run [(op, args), ...] in one go   ║
+║                                                              ║
+║ JavaScript Execution:                                        ║
+║   execute(script)        - Execute JavaScript                ║
+║                                                              ║
+║ Cookies & Storage:                                           ║
+║   get_cookies()          - Get all cookies                   ║
+║   set_cookie(name, val)  - Set cookie                        ║
+║   get_storage()          - Get localStorage                  ║
+║   set_storage(key, val)  - Set localStorage item             ║
+║                                                              ║
+║ Profiles:                                                    ║
+║   load_profile(name)     - Load user profile                 ║
+║   save_profile(name)     - Save current profile              ║
+║   list_profiles()        - List all profiles                 ║
+║                                                              ║
+║ Utility:                                                     ║
+║   screenshot(path)       - Take screenshot                   ║
+║   sleep(seconds)         - Sleep for N seconds               ║
+║   stats                  - Show page statistics              ║
+║   help                   - Show this help                    ║
+║   exit/quit              - Exit CLI                          ║
+║                                                              ║
+║ Multi-line Scripts:                                          ║
+║   Start with \"\"\" (triple quotes)                             ║
+║   End with \"\"\"                                               ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+_BOX_TO_ASCII = str.maketrans("╔╗╚╝╠╣═║", "++++++=|")
+
+
+def _strip_box(text: str) -> str:
+    """Replace box-drawing characters with ASCII equivalents"""
+    return text.translate(_BOX_TO_ASCII)
+
+
 class BrowserCLI:
     """
     Interactive CLI for browser control
     """
     
+    # Adapter classes as "module:Class" paths, imported only when chosen so
+    # startup does not load both Playwright and Selenium
     ADAPTERS = {
-        "playwright-chromium": (PlaywrightAdapter, {"engine": "chromium"}),
-        "playwright-firefox": (PlaywrightAdapter, {"engine": "firefox"}),
-        "playwright-webkit": (PlaywrightAdapter, {"engine": "webkit"}),
-        "selenium-chrome": (SeleniumAdapter, {"browser": "chrome"}),
-        "selenium-firefox": (SeleniumAdapter, {"browser": "firefox"}),
-        "selenium-edge": (SeleniumAdapter, {"browser": "edge"}),
-        "selenium-safari": (SeleniumAdapter, {"browser": "safari"}),
+        "playwright-chromium": (_PLAYWRIGHT, {"engine": "chromium"}),
+        "playwright-firefox": (_PLAYWRIGHT, {"engine": "firefox"}),
+        "playwright-webkit": (_PLAYWRIGHT, {"engine": "webkit"}),
+        "selenium-chrome": (_SELENIUM, {"browser": "chrome"}),
+        "selenium-firefox": (_SELENIUM, {"browser": "firefox"}),
+        "selenium-edge": (_SELENIUM, {"browser": "edge"}),
+        "selenium-safari": (_SELENIUM, {"browser": "safari"}),
     }
     
-    def __init__(self, adapter_name: str = "playwright-chromium", initial_url: Optional[str] = None):
-        """Initialize CLI"""
+    def __init__(self, adapter_name: str = "playwright-chromium", initial_url: Optional[str] = None,
+                 block_resources: Optional[Sequence[str]] = None):
+        """
+        Initialize CLI
+        
+        Args:
+            adapter_name: Key of ADAPTERS to start
+            initial_url: URL to open once the browser is up
+            block_resources: Resource types the adapter skips; None keeps
+                the adapter default, an empty sequence loads everything
+        """
         self.browser: Optional[IBrowserAdapter] = None
+        self.stats_store: Optional[StatsCache] = None
         self.profile_manager = ProfileManager()
         self.current_profile = None
-        self.script_buffer: List[str] = []
+        self.script_buffer: Deque[str] = deque()
         self.running = True
         self.adapter_name = adapter_name
         self.initial_url = initial_url
+        self.block_resources = block_resources
+        
+        # Lines typed by the user, read on a separate thread so browser
+        # events can be printed while the prompt is waiting
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._want_line = threading.Event()
+        self._reading = False
+        self._prompt = ""
+        
+        # Compiled code of recently run commands, keyed by source text
+        self._compile_cache: "OrderedDict[str, CodeType]" = OrderedDict()
+        
+        # Built-in commands; anything else is run as Python
+        self._commands: Dict[str, Callable[[], None]] = {
+            'help': self.show_help,
+            '?': self.show_help,
+            'exit': self._quit,
+            'quit': self._quit,
+            'stats': self.show_statistics,
+        }
         
         # Register event handlers
         self.setup_event_handlers()
@@ -54,8 +177,18 @@ class BrowserCLI:
             print(f"Available adapters: {', '.join(self.ADAPTERS.keys())}")
             sys.exit(1)
         
-        adapter_class, options = self.ADAPTERS[self.adapter_name]
-        self.browser = adapter_class(**options)
+        path, options = self.ADAPTERS[self.adapter_name]
+        options = dict(options)
+        if self.block_resources is not None:
+            options["block_resources"] = self.block_resources
+        self.browser = _adapter_class(path)(**options)
+        
+        # Reuse statistics collected by earlier sessions
+        try:
+            self.stats_store = StatsCache()
+            self.browser.use_stats_store(self.stats_store)
+        except Exception as e:
+            print(f"⚠️  Statistics cache unavailable: {e}")
         
         # Register events
         self.browser.on(BrowserEvent.ON_LOAD, lambda: print("📄 Page loaded"))
@@ -72,50 +205,7 @@ class BrowserCLI:
     
     def show_help(self) -> None:
         """Show help message"""
-        help_text = """
-╔══════════════════════════════════════════════════════════════╗
-║            BrowserHDL - Interactive CLI Help                 ║
-╠══════════════════════════════════════════════════════════════╣
-║ Navigation & Content:                                         ║
-║   navigate(url)          - Navigate to URL                   ║
-║   html()                 - Get page HTML                     ║
-║   refresh()              - Refresh current page              ║
-║   back()                 - Go back                           ║
-║   forward()              - Go forward                        ║
-║                                                              ║
-║ Element Interaction:                                         ║
-║   find(selector)         - Find element by CSS selector      ║
-║   click(selector)        - Click element                     ║
-║   fill(selector, value)  - Fill input field                  ║
-║   wait(selector)         - Wait for element                  ║
-║                                                              ║
-║ JavaScript Execution:                                        ║
-║   execute(script)        - Execute JavaScript                ║
-║                                                              ║
-║ Cookies & Storage:                                           ║
-║   get_cookies()          - Get all cookies                   ║
-║   set_cookie(name, val)  - Set cookie                        ║
-║   get_storage()          - Get localStorage                  ║
-║   set_storage(key, val)  - Set localStorage item             ║
-║                                                              ║
-║ Profiles:                                                    ║
-║   load_profile(name)     - Load user profile                 ║
-║   save_profile(name)     - Save current profile              ║
-║   list_profiles()        - List all profiles                 ║
-║                                                              ║
-║ Utility:                                                     ║
-║   screenshot(path)       - Take screenshot                   ║
-║   sleep(seconds)         - Sleep for N seconds               ║
-║   stats                  - Show page statistics              ║
-║   help                   - Show this help                    ║
-║   exit/quit              - Exit CLI                          ║
-║                                                              ║
-║ Multi-line Scripts:                                          ║
-║   Start with """ (triple quotes)                            ║
-║   End with """                                              ║
-╚══════════════════════════════════════════════════════════════╝
-"""
-        print(help_text)
+        sys.stdout.write(_HELP_TEXT)
     
     def show_statistics(self) -> None:
         """Show page statistics"""
@@ -140,10 +230,12 @@ class BrowserCLI:
         print("Type 'help' for available commands, 'exit' to quit")
         print("="*60 + "\n")
         
+        threading.Thread(target=self._read_lines, daemon=True).start()
+        
         while self.running:
             try:
                 # Get input
-                line = input("browserhdl> ").strip()
+                line = self._next_line("browserhdl> ").strip()
                 
                 if not line:
                     continue
@@ -166,38 +258,81 @@ class BrowserCLI:
         # Cleanup
         if self.browser:
             self.browser.stop()
+        if self.stats_store:
+            self.stats_store.close()
+    
+    def _read_lines(self) -> None:
+        """Read lines from stdin on request, pushing None at end of input"""
+        while True:
+            self._want_line.wait()
+            self._want_line.clear()
+            try:
+                line = input(self._prompt)
+            except EOFError:
+                self._lines.put(None)
+                return
+            self._lines.put(line)
+    
+    def _next_line(self, prompt: str) -> str:
+        """
+        Wait for the next input line, dispatching browser events meanwhile
+        
+        Raises:
+            EOFError: Input was closed
+        """
+        if not self._reading:
+            self._prompt = prompt
+            self._reading = True
+            self._want_line.set()
+        
+        while True:
+            try:
+                line = self._lines.get(timeout=EVENT_POLL_INTERVAL)
+            except queue.Empty:
+                if self.browser:
+                    try:
+                        self.browser.pump_events()
+                    except Exception:
+                        pass
+                continue
+            self._reading = False
+            if line is None:
+                raise EOFError
+            return line
     
     def handle_multiline_script(self) -> None:
         """Handle multi-line script input"""
         print("Entering multi-line mode. End with \"\"\"")
-        self.script_buffer = []
+        self.script_buffer.clear()
         
         while True:
-            line = input("... ")
-            if line.strip() == '"""':
+            line = self._next_line("... ")
+            # Only lines containing the quotes can be the terminator; skip
+            # strip() for the rest
+            if '"""' in line and line.strip() == '"""':
                 break
             self.script_buffer.append(line)
         
         # Execute the script
         script = "\n".join(self.script_buffer)
         self.execute_script(script)
-        self.script_buffer = []
+        self.script_buffer.clear()
     
     def execute_command(self, command: str) -> None:
         """Execute a single command"""
         command = command.strip()
         
-        # Built-in commands
-        if command in ['help', '?']:
-            self.show_help()
-        elif command in ['exit', 'quit']:
-            self.running = False
-        elif command == 'stats':
-            self.show_statistics()
+        builtin = self._commands.get(command)
+        if builtin:
+            builtin()
         else:
             # Try to execute as Python
             self.execute_script(command)
     
+    def _quit(self) -> None:
+        """Leave the command loop"""
+        self.running = False
+    
     def execute_script(self, script: str) -> None:
         """Execute Python script with browser context"""
         if not self.browser:
@@ -210,11 +345,12 @@ class BrowserCLI:
             'navigate': self.browser.navigate,
             'html': self.browser.get_html,
             'execute': self.browser.execute_script,
-            'find': self.browser.find_element,
-            'find_all': self.browser.find_elements,
-            'click': self.browser.click,
-            'fill': self.browser.fill,
-            'wait': self.browser.wait_for_selector,
+            'find': self._selector_command(self.browser.find_element),
+            'find_all': self._selector_command(self.browser.find_elements),
+            'click': self._selector_command(self.browser.click),
+            'fill': self._selector_command(self.browser.fill),
+            'wait': self._selector_command(self.browser.wait_for_selector),
+            'chain': self.browser.batch,
             'screenshot': self.browser.screenshot,
             'get_cookies': self.browser.get_cookies,
             'set_cookie': self.browser.set_cookie,
@@ -228,12 +364,31 @@ class BrowserCLI:
         }
         
         try:
-            exec(script, context)
+            exec(self._compile(script), context)
         except Exception as e:
             print(f"❌ Script error: {e}")
             import traceback
             traceback.print_exc()
     
+    @staticmethod
+    def _selector_command(method: Callable) -> Callable:
+        """Wrap a browser method so its selector argument is normalized first"""
+        def command(selector: str, *args, **kwargs):
+            return method(_normalize_selector(selector), *args, **kwargs)
+        return command
+    
+    def _compile(self, script: str) -> CodeType:
+        """Compile script, reusing the code object of an identical earlier one"""
+        code = self._compile_cache.get(script)
+        if code is None:
+            code = compile(script, "<repl>", "exec")
+            self._compile_cache[script] = code
+            if len(self._compile_cache) > COMPILE_CACHE_SIZE:
+                self._compile_cache.popitem(last=False)
+        else:
+            self._compile_cache.move_to_end(script)
+        return code
+    
     def _load_profile_cmd(self, name: str) -> None:
         """Load profile command"""
         try:
@@ -290,16 +445,23 @@ def main():
     parser.add_argument('url', nargs='?', help='Initial URL to navigate to')
     parser.add_argument('--list-adapters', action='store_true',
                       help='List available adapters')
+    parser.add_argument('--load-all', action='store_true',
+                      help='Load images, fonts, media and stylesheets instead of blocking them')
     
     args = parser.parse_args()
     
+    if not sys.stdout.isatty():
+        global _HELP_TEXT
+        _HELP_TEXT = _strip_box(_HELP_TEXT)
+    
     if args.list_adapters:
         print("Available adapters:")
         for name in BrowserCLI.ADAPTERS.keys():
             print(f"  • {name}")
         return
     
-    cli = BrowserCLI(adapter_name=args.adapter, initial_url=args.url)
+    cli = BrowserCLI(adapter_name=args.adapter, initial_url=args.url,
+                     block_resources=() if args.load_all else None)
     cli.run()
 
 
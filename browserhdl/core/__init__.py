@@ -1,4 +1,9 @@
 """Core browser interface module"""
-from .browser_interface import IBrowserAdapter, BrowserEvent, ProxyConfig, PageStatistics
+from .browser_interface import (
+    IBrowserAdapter, BrowserAdapterBase, BrowserEvent, ProxyConfig, PageStatistics,
+    StatisticsBuffer
+)
+from .stats_cache import StatsCache
 
-__all__ = ['IBrowserAdapter', 'BrowserEvent', 'ProxyConfig', 'PageStatistics']
+__all__ = ['IBrowserAdapter', 'BrowserAdapterBase', 'BrowserEvent', 'ProxyConfig',
+           'PageStatistics', 'StatisticsBuffer', 'StatsCache']
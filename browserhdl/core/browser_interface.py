@@ -1,56 +1,157 @@
 """
-Browser Interface - Abstract base class for all headless browser implementations
+Browser Interface - Protocol and shared base class for all headless browser implementations
 """
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Callable
-from enum import Enum
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Callable, Tuple, Mapping, Protocol, runtime_checkable
+from types import MappingProxyType
+from enum import IntEnum
+from dataclasses import dataclass, replace
+from collections import OrderedDict
+from array import array
+import functools
+import hashlib
 import json
+import os
 
 
-class BrowserEvent(Enum):
+# Maximum number of page statistics kept per adapter
+STATS_CACHE_SIZE = 64
+
+# Number of page loads kept in an adapter's statistics history
+STATS_HISTORY_SIZE = 1024
+
+# Resource types adapters skip loading unless told otherwise. None of them
+# affect the HTML or the page statistics.
+DEFAULT_BLOCKED_RESOURCES: Tuple[str, ...] = ("image", "font", "media", "stylesheet")
+
+# Body of the page statistics collector, shared by all adapters. One
+# evaluation returns every counter PageStatistics needs, so collecting
+# statistics after a navigation costs a single round-trip.
+COLLECT_STATS_JS = """{
+    return {
+        sizeBytes: new Blob([document.documentElement.outerHTML]).size,
+        numTags: document.getElementsByTagName('*').length,
+        numForms: document.forms.length,
+        numLinks: document.links.length,
+        numButtons: document.getElementsByTagName('button').length,
+        numInputs: document.getElementsByTagName('input').length,
+        numImages: document.images.length,
+        title: document.title,
+        cookieLen: document.cookie.length
+    };
+}"""
+
+# Fingerprint of the current page for the statistics cache. Pages with the
+# same URL, content length and cookie length reuse their cached statistics.
+# Only worth probing where a hit saves more than the collector call itself,
+# as with Selenium's extra get_cookies() round-trip.
+STATS_KEY_JS = "[location.href, document.documentElement.outerHTML.length, document.cookie.length]"
+
+# Operations accepted by IBrowserAdapter.batch(), with their CLI aliases
+BATCH_OPS = {
+    "navigate": "navigate",
+    "click": "click",
+    "fill": "fill",
+    "wait": "wait_for_selector",
+    "wait_for_selector": "wait_for_selector",
+    "execute": "execute_script",
+    "execute_script": "execute_script",
+    "find": "find_element",
+    "find_element": "find_element",
+    "find_all": "find_elements",
+    "find_elements": "find_elements",
+    "screenshot": "screenshot",
+    "set_cookie": "set_cookie",
+    "set_storage": "set_local_storage",
+    "set_local_storage": "set_local_storage",
+}
+
+
+class BrowserEvent(IntEnum):
     """Browser events that can be triggered"""
-    ON_LOAD = "onload"
-    ON_START = "onstart"
-    ON_STOP = "onstop"
-    ON_NAVIGATE = "onnavigate"
-    ON_UNLOAD = "onunload"
-    ON_ERROR = "onerror"
-    ON_CONSOLE = "onconsole"
-    ON_DIALOG = "ondialog"
-    ON_DOWNLOAD = "ondownload"
-    ON_REQUEST = "onrequest"
-    ON_RESPONSE = "onresponse"
+    ON_LOAD = 0
+    ON_START = 1
+    ON_STOP = 2
+    ON_NAVIGATE = 3
+    ON_UNLOAD = 4
+    ON_ERROR = 5
+    ON_CONSOLE = 6
+    ON_DIALOG = 7
+    ON_DOWNLOAD = 8
+    ON_REQUEST = 9
+    ON_RESPONSE = 10
+    
+    @property
+    def label(self) -> str:
+        """Event name as used in messages, e.g. 'onload'"""
+        return _EVENT_NAMES[self]
 
 
-@dataclass
+# BrowserEvent labels, indexed by event value
+_EVENT_NAMES: Tuple[str, ...] = (
+    "onload", "onstart", "onstop", "onnavigate", "onunload", "onerror",
+    "onconsole", "ondialog", "ondownload", "onrequest", "onresponse",
+)
+
+
+@dataclass(frozen=True)
 class ProxyConfig:
-    """Proxy configuration for browser"""
+    """Proxy configuration for browser - immutable, so it can be hashed and shared"""
     enabled: bool = False
     host: str = ""
     port: int = 0
     username: Optional[str] = None
     password: Optional[str] = None
     cache_enabled: bool = False
-    filters: List[str] = None
+    filters: Tuple[str, ...] = ()
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+    def __post_init__(self):
+        # Accept None or a list for filters, as older callers pass them
+        object.__setattr__(self, "filters", tuple(self.filters or ()))
+    
+    @functools.cached_property
+    def as_dict(self) -> Mapping[str, Any]:
+        """Read-only mapping of the configuration, built on first access"""
+        return MappingProxyType({
             "enabled": self.enabled,
             "host": self.host,
             "port": self.port,
             "username": self.username,
             "password": self.password,
             "cache_enabled": self.cache_enabled,
-            "filters": self.filters or []
-        }
+            "filters": self.filters
+        })
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable, JSON-ready copy of the configuration"""
+        return dict(self.as_dict, filters=list(self.filters))
+
+
+# Layout of str(PageStatistics), formatted in a single pass
+_STATS_FMT = """
+Page Statistics:
+═══════════════════════════════════════
+URL: %s
+Title: %s
+Status: %s
+Content-Type: %s
+Load Time: %.2fs
+Size: %.2f KB
+Tags: %s
+Forms: %s
+Links: %s
+Buttons: %s
+Inputs: %s
+Images: %s
+Cookies Size: %s bytes
+═══════════════════════════════════════
+"""
 
 
 @dataclass
 class PageStatistics:
     """Statistics about loaded page"""
     url: str
-    load_time: float
+    load_time: float  # seconds, a monotonic delta rather than a timestamp
     size_bytes: int
     num_tags: int
     num_forms: int
@@ -64,144 +165,386 @@ class PageStatistics:
     content_type: str
     
     def __str__(self) -> str:
-        return f"""
-Page Statistics:
-═══════════════════════════════════════
-URL: {self.url}
-Title: {self.page_title}
-Status: {self.status_code}
-Content-Type: {self.content_type}
-Load Time: {self.load_time:.2f}s
-Size: {self.size_bytes / 1024:.2f} KB
-Tags: {self.num_tags}
-Forms: {self.num_forms}
-Links: {self.num_links}
-Buttons: {self.num_buttons}
-Inputs: {self.num_inputs}
-Images: {self.num_images}
-Cookies Size: {self.cookies_size} bytes
-═══════════════════════════════════════
-"""
+        return _STATS_FMT % (
+            self.url, self.page_title, self.status_code, self.content_type,
+            self.load_time, self.size_bytes / 1024, self.num_tags, self.num_forms,
+            self.num_links, self.num_buttons, self.num_inputs, self.num_images,
+            self.cookies_size,
+        )
+
 
+# PageStatistics fields stored as integer and string columns by StatisticsBuffer
+_STATS_INT_FIELDS = (
+    "size_bytes", "num_tags", "num_forms", "num_links", "num_buttons",
+    "num_inputs", "num_images", "cookies_size", "status_code",
+)
+_STATS_STR_FIELDS = ("url", "page_title", "content_type")
 
-class IBrowserAdapter(ABC):
+
+class StatisticsBuffer:
     """
-    Interface that all headless browser adapters must implement.
-    Provides a unified API for different headless browser engines.
+    Fixed-size history of page statistics stored column by column.
+    
+    Numeric fields live in preallocated array.array columns, so a record
+    costs a few machine words rather than a PageStatistics instance with
+    a boxed object per field. Once full, the oldest record is overwritten.
+    Indexing rebuilds a PageStatistics; column() reads one field across
+    the whole history without building records.
     """
     
-    def __init__(self, headless: bool = True, proxy: Optional[ProxyConfig] = None):
+    def __init__(self, capacity: int = STATS_HISTORY_SIZE):
         """
-        Initialize browser adapter
+        Initialize statistics buffer
         
         Args:
-            headless: Run browser in headless mode
-            proxy: Proxy configuration
+            capacity: Maximum number of records kept
         """
-        self.headless = headless
-        self.proxy = proxy
-        self.event_handlers: Dict[BrowserEvent, List[Callable]] = {}
-        self._last_statistics: Optional[PageStatistics] = None
+        self.capacity = capacity
+        self._load_times = array('d', [0.0]) * capacity
+        self._ints = {name: array('q', [0]) * capacity for name in _STATS_INT_FIELDS}
+        self._strs = {name: [""] * capacity for name in _STATS_STR_FIELDS}
+        self._next = 0
+        self._len = 0
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def append(self, stats: PageStatistics) -> None:
+        """Add a record, overwriting the oldest one when full"""
+        i = self._next
+        self._load_times[i] = stats.load_time
+        for name, column in self._ints.items():
+            column[i] = int(getattr(stats, name) or 0)
+        for name, column in self._strs.items():
+            column[i] = getattr(stats, name)
+        self._next = (i + 1) % self.capacity
+        self._len = min(self._len + 1, self.capacity)
+    
+    def _slot(self, index: int) -> int:
+        """Map a record index, oldest first, to its position in the columns"""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("statistics history index out of range")
+        return (self._next - self._len + index) % self.capacity
+    
+    def __getitem__(self, index: int) -> PageStatistics:
+        i = self._slot(index)
+        fields: Dict[str, Any] = {name: column[i] for name, column in self._ints.items()}
+        fields.update((name, column[i]) for name, column in self._strs.items())
+        return PageStatistics(load_time=self._load_times[i], **fields)
+    
+    def column(self, name: str) -> List[Any]:
+        """
+        Values of one PageStatistics field for every record, oldest first
         
-    @abstractmethod
+        Args:
+            name: Field name, e.g. 'load_time' or 'size_bytes'
+        """
+        if name == "load_time":
+            column = self._load_times
+        else:
+            column = self._ints.get(name) or self._strs.get(name)
+            if column is None:
+                raise KeyError(name)
+        return [column[self._slot(i)] for i in range(self._len)]
+
+
+def _safe_handler(event: BrowserEvent, handler: Callable) -> Callable:
+    """Wrap an event handler so an exception is printed instead of raised"""
+    @functools.wraps(handler)
+    def safe(*args, **kwargs):
+        try:
+            handler(*args, **kwargs)
+        except Exception as e:
+            print(f"Error in event handler for {_EVENT_NAMES[event]}: {e}")
+    return safe
+
+
+@runtime_checkable
+class IBrowserAdapter(Protocol):
+    """
+    Interface that all headless browser adapters must implement.
+    Provides a unified API for different headless browser engines.
+    
+    Adapters satisfy it structurally; isinstance() checks that the
+    methods are present. Concrete adapters inherit BrowserAdapterBase
+    for the shared state and helpers.
+    """
+    
+    def __init_subclass__(cls, **kwargs):
+        # Adapters written against the old base class would otherwise get
+        # no state and None from every shared method. Checked at class
+        # definition, since typing replaces a Protocol's __init__ before 3.11.
+        super().__init_subclass__(**kwargs)
+        if Protocol not in cls.__bases__:
+            raise TypeError(
+                f"{cls.__name__}: IBrowserAdapter is a Protocol and cannot be "
+                "subclassed by adapters; subclass BrowserAdapterBase instead")
+    
     def start(self) -> None:
         """Start the browser instance"""
-        pass
+        ...
     
-    @abstractmethod
     def stop(self) -> None:
         """Stop the browser instance"""
-        pass
+        ...
     
-    @abstractmethod
     def navigate(self, url: str) -> None:
         """Navigate to URL"""
-        pass
+        ...
     
-    @abstractmethod
     def get_html(self) -> str:
         """Get current page HTML"""
-        pass
+        ...
     
-    @abstractmethod
     def execute_script(self, script: str) -> Any:
         """Execute JavaScript in page context"""
-        pass
+        ...
     
-    @abstractmethod
     def find_element(self, selector: str) -> Optional[Any]:
         """Find element by CSS selector"""
-        pass
+        ...
     
-    @abstractmethod
     def find_elements(self, selector: str) -> List[Any]:
         """Find all elements by CSS selector"""
-        pass
+        ...
     
-    @abstractmethod
     def click(self, selector: str) -> None:
         """Click element by selector"""
-        pass
+        ...
     
-    @abstractmethod
     def fill(self, selector: str, value: str) -> None:
         """Fill input field"""
-        pass
+        ...
     
-    @abstractmethod
-    def screenshot(self, path: str) -> None:
-        """Take screenshot"""
-        pass
+    def screenshot(self, path: str) -> bool:
+        """Take screenshot, returning False if path already held an identical one"""
+        ...
     
-    @abstractmethod
     def get_cookies(self) -> List[Dict[str, Any]]:
         """Get all cookies"""
-        pass
+        ...
     
-    @abstractmethod
     def set_cookie(self, name: str, value: str, **kwargs) -> None:
         """Set a cookie"""
-        pass
+        ...
+    
+    def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
+        """Set several cookies at once"""
+        ...
     
-    @abstractmethod
     def delete_cookie(self, name: str) -> None:
         """Delete a cookie"""
-        pass
+        ...
     
-    @abstractmethod
     def get_local_storage(self) -> Dict[str, str]:
         """Get localStorage contents"""
-        pass
+        ...
     
-    @abstractmethod
     def set_local_storage(self, key: str, value: str) -> None:
         """Set localStorage item"""
-        pass
+        ...
+    
+    def set_local_storage_bulk(self, items: Dict[str, str]) -> None:
+        """Set several localStorage items at once"""
+        ...
     
-    @abstractmethod
     def wait_for_selector(self, selector: str, timeout: int = 30000) -> None:
         """Wait for element to appear"""
-        pass
+        ...
     
-    @abstractmethod
     def get_statistics(self) -> PageStatistics:
         """Get page statistics"""
-        pass
+        ...
     
     def on(self, event: BrowserEvent, handler: Callable) -> None:
         """Register event handler"""
-        if event not in self.event_handlers:
-            self.event_handlers[event] = []
-        self.event_handlers[event].append(handler)
+        ...
     
     def trigger_event(self, event: BrowserEvent, *args, **kwargs) -> None:
         """Trigger event handlers"""
-        if event in self.event_handlers:
-            for handler in self.event_handlers[event]:
-                try:
-                    handler(*args, **kwargs)
-                except Exception as e:
-                    print(f"Error in event handler for {event.value}: {e}")
+        ...
+    
+    def pump_events(self) -> None:
+        """Dispatch browser events that arrived since the last call"""
+        ...
+    
+    def batch(self, ops: List[Tuple[str, Any]]) -> List[Any]:
+        """Run a sequence of operations, then collect statistics once"""
+        ...
+    
+    def load_profile(self, profile_data: Dict[str, Any]) -> None:
+        """Load user profile (cookies, localStorage, etc.)"""
+        ...
+    
+    def get_last_statistics(self) -> Optional[PageStatistics]:
+        """Get last collected statistics"""
+        ...
+    
+    def use_stats_store(self, store) -> None:
+        """Persist the statistics cache in store, warming the cache from it"""
+        ...
+
+
+class BrowserAdapterBase:
+    """
+    State and behaviour shared by all adapters: events, caches,
+    statistics history, batching and profile loading.
+    
+    Subclasses provide the browser-specific IBrowserAdapter methods.
+    """
+    
+    def __init__(self, headless: bool = True, proxy: Optional[ProxyConfig] = None):
+        """
+        Initialize browser adapter
+        
+        Args:
+            headless: Run browser in headless mode
+            proxy: Proxy configuration
+        """
+        self.headless = headless
+        self.proxy = proxy
+        # One handler list per event, created up front so dispatch is a
+        # single lookup with no membership test
+        self.event_handlers: Dict[BrowserEvent, List[Callable]] = {
+            event: [] for event in BrowserEvent
+        }
+        self.statistics_history = StatisticsBuffer()
+        self._last_statistics: Optional[PageStatistics] = None
+        
+        # Page statistics keyed by a cheap page fingerprint (URL, content
+        # length, ...), so unchanged pages are not counted again
+        self._stats_cache: "OrderedDict[Tuple[Any, ...], PageStatistics]" = OrderedDict()
+        # Optional persistent backing for the statistics cache (StatsCache)
+        self.stats_store = None
+        
+        # SHA-256 digest and path of the last screenshot written, so
+        # identical captures of a static page are not written again
+        self._last_screenshot_hash: Optional[bytes] = None
+        self._last_screenshot_path: Optional[str] = None
+    
+    def on(self, event: BrowserEvent, handler: Callable) -> None:
+        """Register event handler - errors it raises are reported, not propagated"""
+        self.event_handlers[event].append(_safe_handler(event, handler))
+    
+    def trigger_event(self, event: BrowserEvent, *args, **kwargs) -> None:
+        """Trigger event handlers"""
+        for handler in self.event_handlers[event]:
+            handler(*args, **kwargs)
+    
+    def pump_events(self) -> None:
+        """
+        Dispatch browser events that arrived since the last call
+        
+        Drivers that only deliver events while one of their calls is in
+        progress override this, so events reach their handlers while the
+        caller is otherwise idle. The default does nothing.
+        """
+        pass
+    
+    def batch(self, ops: List[Tuple[str, Any]]) -> List[Any]:
+        """
+        Run a sequence of operations, then collect statistics once
+        
+        Args:
+            ops: (operation, arguments) pairs. Operations are adapter method
+                names or their CLI aliases (see BATCH_OPS); arguments are a
+                dict of keyword arguments or a sequence of positional ones.
+            
+        Returns:
+            Result of each operation, in order
+        """
+        methods = self._batch_methods()
+        results = []
+        for op, args in ops:
+            method = methods.get(op)
+            if method is None:
+                raise ValueError(f"Unsupported batch operation: {op}")
+            if isinstance(args, dict):
+                results.append(method(**args))
+            else:
+                results.append(method(*args))
+        
+        self._last_statistics = self.get_statistics()
+        return results
+    
+    def _batch_methods(self) -> Dict[str, Callable]:
+        """Dispatch table used by batch()"""
+        return {op: getattr(self, name) for op, name in BATCH_OPS.items()}
+    
+    def _write_screenshot(self, path: str, data: bytes) -> bool:
+        """
+        Write image data to path unless it repeats the last screenshot
+        
+        Missing parent directories are created.
+        
+        Args:
+            path: Destination file
+            data: Image bytes as captured by the browser
+            
+        Returns:
+            True if the file was written, False if it was left unchanged
+        """
+        digest = hashlib.sha256(data).digest()
+        if (digest == self._last_screenshot_hash and path == self._last_screenshot_path
+                and os.path.exists(path)):
+            return False
+        
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        self._last_screenshot_hash = digest
+        self._last_screenshot_path = path
+        return True
+    
+    def _stats_cache_get(self, key: Tuple[Any, ...],
+                         load_time: float) -> Optional[PageStatistics]:
+        """
+        Return cached statistics for a page fingerprint, or None on miss
+        
+        Args:
+            key: Page fingerprint
+            load_time: Load time of the current visit, replaces the cached one
+        """
+        cached = self._stats_cache.get(key)
+        if cached is None:
+            return None
+        self._stats_cache.move_to_end(key)
+        return replace(cached, load_time=load_time)
+    
+    def _stats_cache_put(self, key: Tuple[Any, ...], stats: PageStatistics) -> None:
+        """Store statistics for a page fingerprint, evicting the oldest entry"""
+        self._stats_cache[key] = stats
+        self._stats_cache.move_to_end(key)
+        if len(self._stats_cache) > STATS_CACHE_SIZE:
+            self._stats_cache.popitem(last=False)
+        if self.stats_store is not None:
+            self.stats_store.put(self._stats_scope(), key, stats)
+    
+    def _stats_scope(self) -> str:
+        """Name under which the statistics store keeps this adapter's entries"""
+        return type(self).__name__
+    
+    def use_stats_store(self, store) -> None:
+        """
+        Persist the statistics cache in store, warming the cache from it
+        
+        Args:
+            store: StatsCache holding statistics from earlier sessions
+        """
+        self.stats_store = None
+        for key, stats in store.load(self._stats_scope()):
+            self._stats_cache_put(key, stats)
+        self.stats_store = store
+    
+    def _flush_stats_store(self) -> None:
+        """Write statistics queued for the persistent store, if any"""
+        if self.stats_store is not None:
+            try:
+                self.stats_store.flush()
+            except Exception as e:
+                print(f"Failed to save statistics: {e}")
     
     def load_profile(self, profile_data: Dict[str, Any]) -> None:
         """
@@ -210,21 +553,35 @@ class IBrowserAdapter(ABC):
         Args:
             profile_data: Dictionary containing profile data
         """
-        # Set cookies
+        # Set cookies - one bulk call, falling back to one at a time so a
+        # single bad cookie does not drop the rest
         if "cookies" in profile_data:
-            for cookie in profile_data["cookies"]:
-                try:
-                    self.set_cookie(**cookie)
-                except Exception as e:
-                    print(f"Failed to set cookie: {e}")
+            try:
+                self.set_cookies(profile_data["cookies"])
+            except Exception:
+                for cookie in profile_data["cookies"]:
+                    try:
+                        self.set_cookie(**cookie)
+                    except Exception as e:
+                        print(f"Failed to set cookie: {e}")
         
         # Set localStorage
         if "localStorage" in profile_data:
-            for key, value in profile_data["localStorage"].items():
-                try:
-                    self.set_local_storage(key, value)
-                except Exception as e:
-                    print(f"Failed to set localStorage: {e}")
+            try:
+                self.set_local_storage_bulk(profile_data["localStorage"])
+            except Exception as e:
+                print(f"Failed to set localStorage: {e}")
+    
+    @property
+    def _last_statistics(self) -> Optional[PageStatistics]:
+        return self._last_stats
+    
+    @_last_statistics.setter
+    def _last_statistics(self, stats: Optional[PageStatistics]) -> None:
+        # Every statistics snapshot an adapter records also goes to the history
+        self._last_stats = stats
+        if stats is not None:
+            self.statistics_history.append(stats)
     
     def get_last_statistics(self) -> Optional[PageStatistics]:
         """Get last collected statistics"""
@@ -0,0 +1,90 @@
+"""
+Stats Cache - SQLite store that keeps page statistics across sessions
+"""
+import json
+import os
+import sqlite3
+import time
+from dataclasses import astuple, fields
+from typing import Any, List, Tuple
+
+from .browser_interface import PageStatistics
+
+
+DEFAULT_STATS_DB = os.path.join(os.path.expanduser("~"), ".browserhdl", "stats.sqlite")
+
+# Entries older than this many seconds are neither loaded nor kept
+DEFAULT_MAX_AGE = 3600
+
+_FIELDS = tuple(f.name for f in fields(PageStatistics))
+_SQL_TYPES = {str: "TEXT", int: "INTEGER", float: "REAL"}
+_COLUMNS = ", ".join(f"{f.name} {_SQL_TYPES[f.type]}" for f in fields(PageStatistics))
+
+# Rows are kept per adapter scope
+_CREATE = (f"CREATE TABLE IF NOT EXISTS page_stats (scope TEXT, key TEXT, {_COLUMNS}, ts REAL, "
+           f"PRIMARY KEY (scope, key))")
+_SELECT = f"SELECT key, {', '.join(_FIELDS)} FROM page_stats WHERE scope = ? AND ts > ? ORDER BY ts"
+_UPSERT = f"INSERT OR REPLACE INTO page_stats VALUES (?, ?, {', '.join('?' * len(_FIELDS))}, ?)"
+_PURGE = "DELETE FROM page_stats WHERE ts <= ?"
+
+
+class StatsCache:
+    """
+    Persistent store for an adapter's statistics cache.
+    
+    Entries are keyed by the adapter's scope, which names the engine and
+    the blocked resource types, and the same page fingerprint as the
+    in-memory cache. Adapters measure pages differently, so each scope
+    only sees its own entries.
+    New entries are queued by put() and written in one transaction by
+    flush(), which adapters call when they stop. The database runs in WAL
+    mode so several CLI sessions can read it while one writes.
+    """
+    
+    def __init__(self, path: str = DEFAULT_STATS_DB, max_age: float = DEFAULT_MAX_AGE):
+        """
+        Open or create the statistics database
+        
+        Args:
+            path: SQLite database file
+            max_age: Seconds after which stored statistics are considered stale
+        """
+        self.path = path
+        self.max_age = max_age
+        self._pending: List[Tuple[Any, ...]] = []
+        
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_CREATE)
+    
+    def load(self, scope: str) -> List[Tuple[Tuple[Any, ...], PageStatistics]]:
+        """Fresh (fingerprint, statistics) pairs of scope, oldest first"""
+        rows = self._conn.execute(_SELECT, (scope, time.time() - self.max_age))
+        return [(tuple(json.loads(row[0])), PageStatistics(*row[1:])) for row in rows]
+    
+    def put(self, scope: str, key: Tuple[Any, ...], stats: PageStatistics) -> None:
+        """Queue statistics of scope for the next flush()"""
+        self._pending.append((scope, json.dumps(list(key)), *astuple(stats), time.time()))
+    
+    def flush(self) -> None:
+        """Write queued statistics and drop stale ones in a single transaction"""
+        if not self._pending:
+            return
+        
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(_UPSERT, self._pending)
+            self._conn.execute(_PURGE, (time.time() - self.max_age,))
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._pending.clear()
+    
+    def close(self) -> None:
+        """Flush queued statistics and close the database"""
+        try:
+            self.flush()
+        finally:
+            self._conn.close()